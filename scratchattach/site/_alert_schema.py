@@ -0,0 +1,100 @@
+# msgspec schema for the classroom alerts API, used by site.alert when msgspec is installed.
+# Decoding straight into these structs parses the JSON and builds the typed objects in one pass.
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+import msgspec
+from msgspec import UNSET, UnsetType
+
+
+class User(msgspec.Struct):
+    pk: int | None = None
+    username: str | None = None
+    thumbnail_url: str | None = None
+    admin: bool | None = False
+
+
+class AdminAction(msgspec.Struct):
+    datetime_created: datetime
+    target_user: User
+    actor: User
+    type: int | None = None
+    object_id: int | None = None
+    extra_data: str | None = None  # this is a JSON string inside the JSON response
+
+
+class Fields(msgspec.Struct):
+    educator_datetime_read: datetime
+    admin_action: AdminAction
+
+
+class Alert(msgspec.Struct):
+    fields: Fields
+    model: str | None = None
+    pk: int | None = None
+
+
+class _MappingStruct(msgspec.Struct):
+    # lets the structs below be read like the dicts from the plain JSON parser, so site.alert can handle both.
+    # fields default to UNSET, so a key that is missing from the JSON stays distinct from one that is null
+    def __contains__(self, key: str) -> bool:
+        return getattr(self, key, UNSET) is not UNSET
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key, UNSET)
+        if value is UNSET:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, UNSET)
+        return default if value is UNSET else value
+
+
+# Only the fields of extra_data that site.alert reads are declared, msgspec skips the rest while decoding.
+class CommentContent(_MappingStruct):
+    content: str | None | UnsetType = UNSET
+    comment_obj_id: int | None | UnsetType = UNSET
+    comment_type: int | None | UnsetType = UNSET
+
+
+class ExtraData(_MappingStruct):
+    project_title: str | None | UnsetType = UNSET
+    comment_content: CommentContent | None | UnsetType = UNSET
+    gallery_title: str | None | UnsetType = UNSET
+    notification_type: str | None | UnsetType = UNSET
+
+
+# Raised when a value doesn't match the schema. The dict based parser in site.alert is more lenient, so this
+# should be handled by falling back to it.
+ValidationError = msgspec.ValidationError
+Raw = msgspec.Raw
+
+# The page is split into undecoded rows first, so one alert that doesn't fit the schema doesn't lose the whole page
+_rows_decoder = msgspec.json.Decoder(list[Raw])
+_alert_decoder = msgspec.json.Decoder(Alert)
+_extra_data_decoder = msgspec.json.Decoder(ExtraData)
+
+
+def decode_rows(data: bytes | str) -> list[Raw]:
+    """
+    Split a page of alerts from the raw response body into the undecoded JSON of each alert
+    """
+    return _rows_decoder.decode(data)
+
+
+def decode_alert(row: Raw) -> Alert:
+    """
+    Decode the JSON of a single alert
+    """
+    return _alert_decoder.decode(row)
+
+
+def decode_extra_data(data: str) -> ExtraData:
+    """
+    Decode the "extra_data" JSON string of an alert
+    """
+    return _extra_data_decoder.decode(data)
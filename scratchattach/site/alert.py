@@ -2,25 +2,252 @@
 
 from __future__ import annotations
 
-import json
-import pprint
 import warnings
 from dataclasses import dataclass, field, KW_ONLY
 from datetime import datetime
-from typing import TYPE_CHECKING, Self, Any
+from functools import lru_cache
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Self, Any, TypeVar
 
 from . import user, project, studio, comment, session
+from ._base import BaseSiteComponent
 from ..utils import enums
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 if TYPE_CHECKING:
     ...
 
+# sentinel for cached values that may legitimately be None
+_UNSET = object()
+
+# site._alert_schema, imported on first use by _load_alert_schema. None if msgspec isn't installed
+_alert_schema = _UNSET
+
+
+def _load_alert_schema():
+    """
+    Import site._alert_schema, which imports msgspec and builds the decoders, the first time a response body is parsed.
+    Returns None if msgspec isn't installed.
+    """
+    global _alert_schema
+    if _alert_schema is _UNSET:
+        try:
+            from . import _alert_schema as alert_schema
+        except ImportError:
+            # msgspec isn't installed
+            alert_schema = None
+        _alert_schema = alert_schema
+    return _alert_schema
+
+
+# Alerts in the same page frequently share timestamps, so parsed datetimes are reused.
+_TS_CACHE: dict[str, datetime] = {}
+_TS_CACHE_SIZE = 512
+
+
+def _parse_ts(timestamp: str) -> datetime:
+    """
+    Parse an ISO timestamp from the alerts API, reusing the result for timestamps that were already seen.
+    """
+    value = _TS_CACHE.get(timestamp)
+    if value is None:
+        if len(_TS_CACHE) >= _TS_CACHE_SIZE:
+            _TS_CACHE.clear()
+        value = _TS_CACHE[timestamp] = datetime.fromisoformat(timestamp)
+    return value
+
+
+def _intern_user(user_id: int | None, username: str | None, icon_url: str | None, admin: bool,
+                 _session: session.Session | None) -> user.User:
+    """
+    Get a User for a user in an alert.
+    If an earlier alert parsed through the session had the same user with the same details, that User object is reused,
+    as the same few admins are the actor of almost every alert.
+    If the details differ (e.g. the user was renamed in between), a new User is created, so every alert keeps the
+    details it was sent with.
+    """
+    cache = getattr(_session, "_user_cache", None)
+    if cache is not None and user_id is not None:
+        cached_user = cache.get(user_id)
+        if cached_user is not None and cached_user.username == username and cached_user.icon_url == icon_url \
+                and cached_user.admin == admin:
+            return cached_user
+
+    new_user = user.User(username=username,
+                         id=user_id,
+                         icon_url=icon_url,
+                         admin=admin,
+                         _session=_session)
+    if cache is not None and user_id is not None:
+        cache[user_id] = new_user
+    return new_user
+
+
+def _user_from_json(user_data: dict[str, Any], _session: session.Session | None) -> user.User:
+    """
+    Get a User from the user JSON in an alert
+    """
+    _uf = user_data.get
+    return _intern_user(_uf("pk"), _uf("username"), _uf("thumbnail_url"), _uf("admin", False), _session)
+
+
+C = TypeVar("C", bound=BaseSiteComponent)
+
+
+def _cached_object(kind: type[C], object_id: int | None, title: str | None, _session: session.Session | None) -> C:
+    """
+    Get a project or studio with the given id and title, reusing the one an earlier alert parsed through the session
+    created (if any), as bursts of alerts are often about the same project.
+    The title is part of the key, as each alert holds the title at the time of the admin action, which can differ
+    between alerts (e.g. when a project was renamed before being censored).
+    The cached object's title is checked again on reuse, as it changes if the object is updated.
+    """
+    cache = getattr(_session, "_object_cache", None)
+    if cache is None or object_id is None or not isinstance(title, (str, type(None))):
+        return kind(id=object_id, title=title, _session=_session)
+
+    key = (kind, object_id, title)
+    obj = cache.get(key)
+    if obj is None or obj.title != title:
+        obj = cache[key] = kind(id=object_id, title=title, _session=_session)
+    return obj
+
+
+@lru_cache(maxsize=64)
+def _find_alert_type(alert_type_id: int) -> enums.AlertType:
+    """
+    Find the AlertType for an alert type index, falling back to the default AlertType.
+    """
+    alert_type = enums.AlertTypes.find(alert_type_id)
+    if not alert_type:
+        alert_type = enums.AlertTypes.default.value
+
+    return alert_type
+
+
+class _LazyWarning(str):
+    """
+    Warning message for a part of the alert JSON that the parser doesn't recognise.
+    The full response is only pretty-printed when the warning is actually shown, so filtered warnings cost nothing.
+    Warning filters (and the registry of already shown warnings) match against the message without the full response,
+    which includes the object_id so that each unrecognised alert is still reported.
+    """
+
+    def __new__(cls, subject: str, object_id: Any, data: Any):
+        self = super().__new__(cls, f"The parser was not able to recognise {subject} in the alert JSON response "
+                                    f"(object_id: {object_id}).")
+        if not isinstance(data, dict):
+            # alerts parsed with msgspec pass their undecoded JSON, which points into the whole response page.
+            # Only that alert's JSON is copied, as the warnings registry can keep this object alive
+            data = bytes(data)
+        self.data = data
+        return self
+
+    def __str__(self):
+        import pprint  # only needed once a warning is shown
+
+        data = self.data
+        if isinstance(data, bytes):
+            data = _loads(data)
+
+        return (f"{str.__str__(self)}\n"
+                f"Full response: \n{pprint.pformat(data)}.\n\n"
+                f"Please draft an issue on github: https://github.com/TimMcCool/scratchattach/issues, providing this "
+                f"whole error message. This will allow us to implement an incomplete part of this parser")
+
+
+# Types of target_object that have a title. from_json only creates these exact classes, never subclasses
+_TITLED_TYPES: frozenset[type] = frozenset({project.Project, studio.Studio})
+
+# Maps the "comment_type" in a comment alert's extra_data to the source of the comment
+_COMMENT_SOURCE_TYPES: dict[int, str] = {
+    0: "project",
+    1: "profile",
+}
+
+# Handlers for the different kinds of "extra_data" in an alert.
+# Each one takes (object_id, extra_data, data, _session) and returns (target_object, notification_type).
+
+def _handle_project(object_id: int, extra_data: dict[str, Any], data: dict[str, Any],
+                    _session: session.Session) -> tuple[project.Project, None]:
+    return _cached_object(project.Project, object_id, extra_data["project_title"], _session), None
+
+
+def _handle_comment(object_id: int, extra_data: dict[str, Any], data: dict[str, Any],
+                    _session: session.Session) -> tuple[comment.Comment, None]:
+    comment_data: dict[str, Any] = extra_data["comment_content"]
+    _cf = comment_data.get
+    content: str | None = _cf("content")
+
+    comment_obj_id: int | None = _cf("comment_obj_id")
+
+    comment_type: int | None = _cf("comment_type")
+
+    comment_source_type = _COMMENT_SOURCE_TYPES.get(comment_type)
+    if comment_source_type is None:
+        # probably a studio
+        comment_source_type = "Unknown"
+        warnings.warn(_LazyWarning(f"the \"comment_type\" of {comment_type}", object_id, data))
+
+    # the comment_obj's corresponding attribute of comment.Comment is the place() method. As it has no cache, the title data is wasted.
+    # if the comment_obj is deleted, this is still a valid way of working out the title/username
+
+    return comment.Comment(
+        id=object_id,
+        content=content,
+        source=comment_source_type,
+        source_id=comment_obj_id,
+        _session=_session
+    ), None
+
+
+def _handle_studio(object_id: int, extra_data: dict[str, Any], data: dict[str, Any],
+                   _session: session.Session) -> tuple[studio.Studio, None]:
+    # possible implemented incorrectly
+    return _cached_object(studio.Studio, object_id, extra_data["gallery_title"], _session), None
+
+
+def _handle_notification(object_id: int, extra_data: dict[str, Any], data: dict[str, Any],
+                         _session: session.Session) -> tuple[None, str]:
+    # possible implemented incorrectly
+    return None, extra_data["notification_type"]
+
+
+# NOTE: the order matters here, it is the order in which the keys are checked
+_EXTRA_DATA_HANDLERS = {
+    "project_title": _handle_project,
+    "comment_content": _handle_comment,
+    "gallery_title": _handle_studio,
+    "notification_type": _handle_notification,
+}
+
+
+def _parse_extra_data(object_id: int, extra_data: dict[str, Any], data: Any, _session: session.Session | None) \
+        -> tuple[project.Project | studio.Studio | comment.Comment | None, str | None]:
+    """
+    Work out the target object and notification type of an alert from its extra_data.
+    extra_data is either the parsed JSON dict or a site._alert_schema.ExtraData, which can be read in the same way.
+    data is the whole alert (as a dict, or as undecoded JSON from the msgspec path), which is only used in warnings.
+    """
+    # todo: if possible, properly implement the incomplete parts of this parser (look for warning.warn())
+    # the first key (in priority order) that is present in extra_data decides what the alert is about
+    for key, handler in _EXTRA_DATA_HANDLERS.items():
+        if key in extra_data:
+            return handler(object_id, extra_data, data, _session)
+
+    warnings.warn(_LazyWarning("the \"extra_data\"", object_id, data))
+    return None, None
+
 
 # todo: implement regular alerts
 # If you implement regular alerts, it may be applicable to make EducatorAlert a subclass.
 
 
-@dataclass
+@dataclass(slots=True)
 class EducatorAlert:
     """
     Represents an alert for student activity, viewable at https://scratch.mit.edu/site-api/classrooms/alerts/
@@ -28,7 +255,7 @@ class EducatorAlert:
     Attributes:
         model: The type of alert (presumably); should always equal "educators.educatoralert" in this class
         type: An integer that identifies the type of alert, differentiating e.g. against bans or autoban or censored comments etc
-        raw: The raw JSON data from the API
+        raw: The raw JSON data from the API (only kept if the alert was loaded with keep_raw=True)
         id: The ID of the alert (internally called 'pk' by scratch, not sure what this is for)
         time_read: The time the alert was read
         time_created: The time the alert was created
@@ -50,14 +277,20 @@ class EducatorAlert:
     notification_type: str = None
     _session: session.Session = None
 
+    # caches for the derived properties below. cached_property can't be used as the class has no __dict__
+    _alert_type: enums.AlertType = field(init=False, repr=False, compare=False, default=None)
+    _message: str = field(init=False, repr=False, compare=False, default=None)
+    _target_object_title: str | None = field(init=False, repr=False, compare=False, default=_UNSET)
+
     @classmethod
-    def from_json(cls, data: dict[str, Any], _session: session.Session = None) -> Self:
+    def from_json(cls, data: dict[str, Any], _session: session.Session = None, *, keep_raw: bool = False) -> Self:
         """
         Load an EducatorAlert from a JSON object.
 
         Arguments:
             data (dict): The JSON object
             _session (session.Session): The session object used to load this data, to 'connect' to the alerts rather than just 'get' them
+            keep_raw (bool): Whether to store the JSON object in the raw attribute of the alert
 
         Returns:
             EducatorAlert: The loaded EducatorAlert object
@@ -67,98 +300,32 @@ class EducatorAlert:
 
         fields: dict[str, Any] = data.get("fields")
 
-        time_read: datetime = datetime.fromisoformat(fields.get("educator_datetime_read"))
+        time_read: datetime = _parse_ts(fields.get("educator_datetime_read"))
 
         admin_action: dict[str, Any] = fields.get("admin_action")
+        # bound once, as it is called for nearly every field below
+        _af = admin_action.get
 
-        time_created: datetime = datetime.fromisoformat(admin_action.get("datetime_created"))
-
-        alert_type: int = admin_action.get("type")
-
-        target_data: dict[str, Any] = admin_action.get("target_user")
-        target = user.User(username=target_data.get("username"),
-                           id=target_data.get("pk"),
-                           icon_url=target_data.get("thumbnail_url"),
-                           admin=target_data.get("admin", False),
-                           _session=_session)
-
-        actor_data: dict[str, Any] = admin_action.get("actor")
-        actor = user.User(username=actor_data.get("username"),
-                          id=actor_data.get("pk"),
-                          icon_url=actor_data.get("thumbnail_url"),
-                          admin=actor_data.get("admin", False),
-                          _session=_session)
-
-        object_id: int = admin_action.get("object_id")  # this could be a comment id, a project id, etc.
-        target_object: project.Project | studio.Studio | comment.Comment | None = None
-
-        extra_data: dict[str, Any] = json.loads(admin_action.get("extra_data", "{}"))
-        # todo: if possible, properly implement the incomplete parts of this parser (look for warning.warn())
-        notification_type: str = None
-
-        if "project_title" in extra_data:
-            # project
-            target_object = project.Project(id=object_id,
-                                            title=extra_data["project_title"],
-                                            _session=_session)
-        elif "comment_content" in extra_data:
-            # comment
-            comment_data: dict[str, Any] = extra_data["comment_content"]
-            content: str | None = comment_data.get("content")
-
-            comment_obj_id: int | None = comment_data.get("comment_obj_id")
-
-            comment_type: int | None = comment_data.get("comment_type")
-
-            if comment_type == 0:
-                # project
-                comment_source_type = "project"
-            elif comment_type == 1:
-                # profile
-                comment_source_type = "profile"
-            else:
-                # probably a studio
-                comment_source_type = "Unknown"
-                warnings.warn(
-                    f"The parser was not able to recognise the \"comment_type\" of {comment_type} in the alert JSON response.\n"
-                    f"Full response: \n{pprint.pformat(data)}.\n\n"
-                    f"Please draft an issue on github: https://github.com/TimMcCool/scratchattach/issues, providing this "
-                    f"whole error message. This will allow us to implement an incomplete part of this parser")
-
-            # the comment_obj's corresponding attribute of comment.Comment is the place() method. As it has no cache, the title data is wasted.
-            # if the comment_obj is deleted, this is still a valid way of working out the title/username
-
-            target_object = comment.Comment(
-                id=object_id,
-                content=content,
-                source=comment_source_type,
-                source_id=comment_obj_id,
-                _session=_session
-            )
-
-        elif "gallery_title" in extra_data:
-            # studio
-            # possible implemented incorrectly
-            target_object = studio.Studio(
-                id=object_id,
-                title=extra_data["gallery_title"],
-                _session=_session
-            )
-        elif "notification_type" in extra_data:
-            # possible implemented incorrectly
-            notification_type = extra_data["notification_type"]
-        else:
-            warnings.warn(
-                f"The parser was not able to recognise the \"extra_data\" in the alert JSON response.\n"
-                f"Full response: \n{pprint.pformat(data)}.\n\n"
-                f"Please draft an issue on github: https://github.com/TimMcCool/scratchattach/issues, providing this "
-                f"whole error message. This will allow us to implement an incomplete part of this parser")
+        time_created: datetime = _parse_ts(_af("datetime_created"))
+
+        alert_type: int = _af("type")
+
+        target: user.User = _user_from_json(_af("target_user"), _session)
+        actor: user.User = _user_from_json(_af("actor"), _session)
+
+        object_id: int = _af("object_id")  # this could be a comment id, a project id, etc.
+
+        # extra_data is a JSON string nested inside the response. Alerts such as bans leave it empty,
+        # in which case there is nothing to parse.
+        raw_extra_data: str | None = _af("extra_data")
+        extra_data: dict[str, Any] = _loads(raw_extra_data) if raw_extra_data else {}
+        target_object, notification_type = _parse_extra_data(object_id, extra_data, data, _session)
 
         return cls(
             id=alert_id,
             model=model,
             type=alert_type,
-            raw=data,
+            raw=data if keep_raw else None,
             time_read=time_read,
             time_created=time_created,
             target=target,
@@ -168,6 +335,96 @@ class EducatorAlert:
             _session=_session
         )
 
+    @classmethod
+    def from_json_list(cls, data: bytes | str | list[dict[str, Any]], _session: session.Session = None, *,
+                       keep_raw: bool = False) -> list[Self]:
+        """
+        Load a list of EducatorAlerts from a page of alerts.
+
+        Arguments:
+            data (bytes | str | list): The raw response body from the alerts API, or the already parsed list of alerts
+            _session (session.Session): The session object used to load this data
+            keep_raw (bool): Whether to store the JSON object of each alert in its raw attribute
+
+        Returns:
+            list[EducatorAlert]: The loaded EducatorAlert objects
+        """
+        return list(cls.iter_from_response(data, _session, keep_raw=keep_raw))
+
+    @classmethod
+    def iter_from_response(cls, data: bytes | str | list[dict[str, Any]], _session: session.Session = None, *,
+                           keep_raw: bool = False) -> Iterator[Self]:
+        """
+        Lazily load EducatorAlerts from a page of alerts. Each alert is only built once it is reached,
+        so stopping early skips building the rest.
+
+        Arguments:
+            data (bytes | str | list): The raw response body from the alerts API, or the already parsed list of alerts
+            _session (session.Session): The session object used to load this data
+            keep_raw (bool): Whether to store the JSON object of each alert in its raw attribute
+
+        Returns:
+            Iterator[EducatorAlert]: The loaded EducatorAlert objects
+        """
+        if isinstance(data, (bytes, bytearray, str)):
+            alert_schema = None if keep_raw else _load_alert_schema()
+            if alert_schema is not None:
+                # decode straight into typed structs, skipping the intermediate dicts
+                from_struct = cls._from_struct
+                from_json = cls.from_json
+                for row in alert_schema.decode_rows(data):
+                    try:
+                        alert_data = alert_schema.decode_alert(row)
+                    except alert_schema.ValidationError:
+                        # this alert doesn't fit the schema, so leave it to the more lenient dict parser
+                        yield from_json(_loads(bytes(row)), _session)
+                        continue
+                    yield from_struct(alert_data, row, _session)
+                return
+
+            data = _loads(data)
+
+        # bind the constructor locally to avoid a classmethod lookup for every alert in the page
+        from_json = cls.from_json
+        for alert_data in data:
+            yield from_json(alert_data, _session, keep_raw=keep_raw)
+
+    @classmethod
+    def _from_struct(cls, data: _alert_schema.Alert, row: _alert_schema.Raw, _session: session.Session = None) -> Self:
+        """
+        Load an EducatorAlert from an alert decoded with msgspec (see site._alert_schema).
+        row is the undecoded JSON of the alert, which is only used in warnings.
+        """
+        fields = data.fields
+        admin_action = fields.admin_action
+        target_data = admin_action.target_user
+        actor_data = admin_action.actor
+
+        raw_extra_data: str | None = admin_action.extra_data
+        alert_schema = _load_alert_schema()
+        extra_data: _alert_schema.ExtraData | dict[str, Any] = {}
+        if raw_extra_data:
+            try:
+                extra_data = alert_schema.decode_extra_data(raw_extra_data)
+            except alert_schema.ValidationError:
+                extra_data = _loads(raw_extra_data)
+        target_object, notification_type = _parse_extra_data(admin_action.object_id, extra_data, row, _session)
+
+        return cls(
+            id=data.pk,
+            model=data.model,
+            type=admin_action.type,
+            time_read=fields.educator_datetime_read,
+            time_created=admin_action.datetime_created,
+            target=_intern_user(target_data.pk, target_data.username, target_data.thumbnail_url, target_data.admin,
+                                _session),
+            actor=_intern_user(actor_data.pk, actor_data.username, actor_data.thumbnail_url, actor_data.admin,
+                               _session),
+            target_object=target_object,
+            notification_type=notification_type,
+            _session=_session
+        )
+
     def __str__(self):
         return f"EducatorAlert: {self.message}"
 
@@ -176,35 +433,40 @@ class EducatorAlert:
         """
         Get an associated AlertType object for this alert (based on the type index)
         """
-        alert_type = enums.AlertTypes.find(self.type)
-        if not alert_type:
-            alert_type = enums.AlertTypes.default.value
-
-        return alert_type
+        if self._alert_type is None:
+            self._alert_type = _find_alert_type(self.type)
+        return self._alert_type
 
     @property
     def message(self):
         """
         Format the alert message using the alert type's message template, as it would be on the website.
         """
-        raw_message = self.alert_type.message
+        if self._message is not None:
+            return self._message
+
         comment_content = ""
         if isinstance(self.target_object, comment.Comment):
             comment_content = self.target_object.content
 
-        return raw_message.format(username=self.target.username,
-                                  project=self.target_object_title,
-                                  studio=self.target_object_title,
-                                  notification_type=self.notification_type,
-                                  comment=comment_content)
+        self._message = self.alert_type.render(username=self.target.username,
+                                               project=self.target_object_title,
+                                               studio=self.target_object_title,
+                                               notification_type=self.notification_type,
+                                               comment=comment_content)
+        return self._message
 
     @property
     def target_object_title(self):
         """
         Get the title of the target object (if applicable)
         """
-        if isinstance(self.target_object, project.Project):
-            return self.target_object.title
-        if isinstance(self.target_object, studio.Studio):
-            return self.target_object.title
+        if self._target_object_title is _UNSET:
+            self._target_object_title = self._get_target_object_title()
+        return self._target_object_title
+
+    def _get_target_object_title(self):
+        target_object = self.target_object
+        if type(target_object) in _TITLED_TYPES:
+            return target_object.title
         return None  # explicit
@@ -10,6 +10,7 @@ import random
 import re
 import time
 import warnings
+import weakref
 from typing import Optional, TypeVar, TYPE_CHECKING, overload
 from contextlib import contextmanager
 from threading import local
@@ -95,6 +96,12 @@ class Session(BaseSiteComponent):
         # Set attributes that Session object may get
         self._user: user.User = None
 
+        # Users from alerts parsed through this session, keyed by id. Used to share User objects between alerts.
+        self._user_cache: weakref.WeakValueDictionary[int, user.User] = weakref.WeakValueDictionary()
+        # Same for projects and studios from alerts, keyed by (class, id, title)
+        self._object_cache: weakref.WeakValueDictionary[tuple[type, int, str | None], BaseSiteComponent] = \
+            weakref.WeakValueDictionary()
+
         # Update attributes from entries dict:
         self.__dict__.update(entries)
 
@@ -251,10 +258,13 @@ class Session(BaseSiteComponent):
         )
 
     def classroom_alerts(self, _classroom: Optional[classroom.Classroom | int] = None, mode: str = "Last created",
-                         page: Optional[int] = None):
+                         page: Optional[int] = None, *, keep_raw: bool = False):
         """
         Load and parse admin alerts, optionally for a specific class, using https://scratch.mit.edu/site-api/classrooms/alerts/
 
+        Keyword arguments:
+            keep_raw (bool): Whether to keep the raw JSON data of each alert in its raw attribute
+
         Returns:
             list[alert.EducatorAlert]: A list of parsed EducatorAlert objects
         """
@@ -269,13 +279,11 @@ class Session(BaseSiteComponent):
 
         ascsort, descsort = get_class_sort_mode(mode)
 
-        data = requests.get(f"https://scratch.mit.edu/site-api/classrooms/alerts/{_classroom_str}",
-                            params={"page": page, "ascsort": ascsort, "descsort": descsort},
-                            headers=self._headers, cookies=self._cookies).json()
-
-        alerts = [alert.EducatorAlert.from_json(alert_data, self) for alert_data in data]
+        response = requests.get(f"https://scratch.mit.edu/site-api/classrooms/alerts/{_classroom_str}",
+                                params={"page": page, "ascsort": ascsort, "descsort": descsort},
+                                headers=self._headers, cookies=self._cookies)
 
-        return alerts
+        return alert.EducatorAlert.from_json_list(response.content, self, keep_raw=keep_raw)
 
     def clear_messages(self):
         """
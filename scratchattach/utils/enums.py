@@ -4,7 +4,8 @@ Adapted from https://translate-service.scratch.mit.edu/supported?language=en
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from string import Formatter
 from enum import Enum
 from typing import Optional, Callable, Iterable
 
@@ -199,11 +200,44 @@ class TTSVoices(_EnumWrapper):
 class AlertType:
     id: int
     message: str
+    # the message template, split into (literal_text, field_name, format_spec, conversion) tuples
+    _compiled: tuple[tuple[str, str | None, str | None, str | None], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._compiled = tuple(Formatter().parse(self.message))
+        for _, field_name, format_spec, _ in self._compiled:
+            if field_name is not None and not field_name.isidentifier():
+                raise ValueError(f"AlertType messages only support plain {{name}} fields, not {{{field_name}}}")
+            if format_spec and "{" in format_spec:
+                raise ValueError(f"AlertType messages don't support nested fields in format specs: {format_spec!r}")
+
+    def render(self, **kwargs) -> str:
+        """
+        Fill in the message template. Equivalent to self.message.format(**kwargs) for the plain
+        {name}, {name!conversion} and {name:spec} fields that are allowed in AlertType messages,
+        but the template is only parsed once.
+        """
+        parts = []
+        for literal, field_name, format_spec, conversion in self._compiled:
+            parts.append(literal)
+            if field_name is None:
+                continue
+
+            value = kwargs[field_name]
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "s":
+                value = str(value)
+            elif conversion == "a":
+                value = ascii(value)
+            parts.append(format(value, format_spec))
+
+        return "".join(parts)
 
 
 class AlertTypes(_EnumWrapper):
     """
-    Enum for associating alert type indecies with their messages, for use with the str.format() method.
+    Enum for associating alert type indecies with their messages, for use with the AlertType.render() method.
     """
     # Reference: https://github.com/TimMcCool/scratchattach/issues/304#issuecomment-2800110811
     # NOTE: THE TEXT WITHIN THE BRACES HERE MATTERS! IF YOU WANT TO CHANGE IT, MAKE SURE TO EDIT `site.alert.EducatorAlert`!
@@ -0,0 +1,89 @@
+import json
+import sys
+import warnings
+
+import pytest
+
+sys.path.insert(0, ".")
+from scratchattach.site import alert
+
+
+def _user(pk, username, admin=False):
+    return {"pk": pk, "username": username, "thumbnail_url": f"https://example.com/{pk}.png", "admin": admin}
+
+
+def _alert(pk, alert_type, extra_data, object_id=99):
+    return {
+        "model": "educators.educatoralert",
+        "pk": pk,
+        "fields": {
+            "educator_datetime_read": "2024-05-01T12:34:56",
+            "admin_action": {
+                "datetime_created": "2024-05-01T10:00:00",
+                "type": alert_type,
+                "target_user": _user(5, "student"),
+                "actor": _user(1, "admin", True),
+                "object_id": object_id,
+                "extra_data": extra_data,
+            },
+        },
+    }
+
+
+PAGE = [
+    _alert(1, 20, json.dumps({"project_title": "Project"})),
+    _alert(2, 22, json.dumps({"comment_content": {"content": "hi", "comment_obj_id": 3, "comment_type": 0,
+                                                  "unused": {"a": 1}}})),
+    _alert(3, 22, json.dumps({"comment_content": {"content": "hey", "comment_obj_id": 4, "comment_type": 1}})),
+    _alert(4, 22, json.dumps({"comment_content": {"content": "?", "comment_type": 7}})),  # unknown comment type
+    _alert(5, 14, json.dumps({"gallery_title": "Studio"})),
+    _alert(6, 4, json.dumps({"notification_type": "Notification"})),
+    _alert(7, 20, json.dumps({"project_title": None})),
+    _alert(8, 0, ""),
+    _alert(9, 0, "{}"),
+    _alert(10, 0, None),
+    _alert(11, 0, json.dumps({"unknown": 1})),
+    # doesn't fit the msgspec schema, so it falls back to the dict parser
+    _alert(12, 20, json.dumps({"project_title": "Fallback"}), object_id="9"),
+]
+
+
+def _summary(educator_alert):
+    target_object = educator_alert.target_object
+    return (
+        educator_alert.id,
+        educator_alert.model,
+        educator_alert.type,
+        educator_alert.time_read,
+        educator_alert.time_created,
+        educator_alert.target.username,
+        educator_alert.actor.username,
+        educator_alert.actor.admin,
+        type(target_object),
+        getattr(target_object, "id", None),
+        educator_alert.target_object_title,
+        getattr(target_object, "content", None),
+        getattr(target_object, "source", None),
+        getattr(target_object, "source_id", None),
+        educator_alert.notification_type,
+        educator_alert.message,
+    )
+
+
+def _parse_page():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return [_summary(a) for a in alert.EducatorAlert.from_json_list(json.dumps(PAGE).encode())]
+
+
+def test_alert_parsers_match(monkeypatch):
+    pytest.importorskip("msgspec")
+    assert alert._load_alert_schema() is not None
+    with_msgspec = _parse_page()
+
+    monkeypatch.setattr(alert, "_load_alert_schema", lambda: None)
+    without_msgspec = _parse_page()
+
+    assert len(with_msgspec) == len(PAGE)
+    for with_row, without_row in zip(with_msgspec, without_msgspec):
+        assert with_row == without_row